@@ -1,24 +1,57 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
+import bisect
+import functools
 import re
 import os
 from datetime import datetime
 from typing import List, Dict
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# Spacy imports with fallback
+# Analyses are short and single-text, so multi-threaded BLAS only adds
+# thread wake-up and cache-thrash overhead; cap it before numpy/spacy
+# load their backends (respects values the user already set)
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+# Spacy imports with fallback; SPACY_AVAILABLE means the library is
+# importable - the model itself is loaded lazily by _get_nlp()
 try:
     import spacy
+    from spacy.matcher import PhraseMatcher
     SPACY_AVAILABLE = True
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        SPACY_AVAILABLE = False
-        print("Spacy model 'en_core_web_sm' not found. Using fallback NLP.")
 except ImportError:
     SPACY_AVAILABLE = False
     print("Spacy not installed. Using fallback NLP.")
 
+_nlp = None
+
+
+def _get_nlp():
+    """Load the Spacy model on first use so the GUI starts instantly.
+    Returns None (and falls back to pattern matching) when Spacy or the
+    model is unavailable."""
+    global _nlp, SPACY_AVAILABLE
+    if not SPACY_AVAILABLE:
+        return None
+    if _nlp is None:
+        try:
+            # The analyzer only needs sentence boundaries, POS/tags, lemmas
+            # and PERSON entities - the dependency parse itself is never
+            # used, so swap the parser for the much lighter senter component
+            try:
+                _nlp = spacy.load("en_core_web_sm", exclude=["parser"])
+                _nlp.enable_pipe("senter")
+            except ValueError:
+                _nlp = spacy.load("en_core_web_sm")
+        except OSError:
+            SPACY_AVAILABLE = False
+            print("Spacy model 'en_core_web_sm' not found. Using fallback NLP.")
+            return None
+    return _nlp
+
 try:
     import docx
     DOCX_AVAILABLE = True
@@ -26,188 +59,428 @@ except ImportError:
     DOCX_AVAILABLE = False
     print("python-docx not installed. DOCX files won't be supported.")
 
+# Optional multi-pattern matcher that scans text in one pass; results
+# are identical to the regex fallback, just faster on large inputs
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# numpy ships with spacy, but the fallback path must work without it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional Aho-Corasick automaton: the literal cue phrases can then be
+# found with one linear scan of the lowered sentence
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 class MeetingNotesAnalyzer:
     def __init__(self):
-        # Fallback patterns for when Spacy is not available
+        # Fallback patterns for when Spacy is not available. Each category
+        # is fused into a single alternation so every line is scanned once
+        # per category instead of once per pattern.
+        # Assignments like 'John will ...' depend on capitalization, so
+        # this pattern is kept case-sensitive against the original line
+        self._action_name_pattern = r'\b([A-Z][a-z]+\s+(?:will|should|must|needs to))\s+([^.!?]+)'
+
         self.action_patterns = [
             r'\b(?:will|should|must|need to|have to|going to)\s+([^.!?]+)',
             r'\b(?:action|task|todo|follow up|next step)[:]\s*([^.!?]+)',
-            r'\b([A-Z][a-z]+\s+(?:will|should|must|needs to))\s+([^.!?]+)',
+            self._action_name_pattern,
             r'\b(?:assign|delegate|responsible for)\s+([^.!?]+)',
         ]
-        
+
         self.decision_patterns = [
             r'\b(?:decided|agreed|resolved|concluded|determined)\s+(?:to|that)\s+([^.!?]+)',
             r'\b(?:we|they|it was)\s+(?:decided|agreed|resolved)\s+([^.!?]+)',
             r'\b(?:decision|conclusion|agreement)[:]\s*([^.!?]+)',
             r'\b(?:final|official)\s+(?:decision|call|verdict)\s+([^.!?]+)',
         ]
-        
+
+        # A bare '?' anywhere marks a question; the loops check for it
+        # directly, which is both faster and clearer than the old
+        # backtracking catch-all pattern r'([^.!?]*\?)'
         self.question_patterns = [
-            r'([^.!?]*\?)',
             r'\b(?:question|ask|wondering|unclear|unsure)\s+(?:about|if|whether)\s+([^.!?]+)',
             r'\b(?:what|how|when|where|why|who)\s+([^.!?]+\?)',
             r'\b(?:need to clarify|need clarification|open item)\s+([^.!?]+)',
         ]
 
+        self.action_re = self._fuse_patterns(
+            [p for p in self.action_patterns if p is not self._action_name_pattern])
+        self.action_name_re = re.compile(self._action_name_pattern)
+        self.decision_re = self._fuse_patterns(self.decision_patterns)
+        self.question_re = self._fuse_patterns(self.question_patterns)
+
+        self._hs_databases = self._build_hyperscan_dbs() if HYPERSCAN_AVAILABLE else None
+
+        # Cue words for the Spacy-path classifiers. Single words are
+        # frozensets checked against the sentence's token set (O(1) per
+        # token); only multi-word phrases still need substring search.
+        self._question_words = frozenset({'what', 'how', 'when', 'where',
+                                          'why', 'who', 'which', 'whose'})
+        self._question_aux = frozenset({'do', 'does', 'did', 'can', 'could',
+                                        'will', 'would', 'should'})
+        self._uncertainty_single = frozenset({'unclear', 'unsure', 'question',
+                                              'wondering', 'tbd'})
+        self._uncertainty_multi = ('not sure', 'need clarification',
+                                   'open item', 'to be determined')
+
+        self._decision_verbs = frozenset({'decided', 'agreed', 'resolved',
+                                          'concluded', 'determined', 'approved',
+                                          'confirmed', 'finalized', 'settled'})
+        self._decision_nouns = frozenset({'decision', 'agreement', 'resolution',
+                                          'conclusion', 'approval', 'confirmation',
+                                          'verdict', 'ruling'})
+        self._passive_decisions = ('it was decided', 'it was agreed',
+                                   'it was resolved')
+
+        self._action_single = frozenset({'will', 'should', 'must', 'action',
+                                         'task', 'todo', 'assign', 'responsible',
+                                         'deliverable', 'owner'})
+        self._action_multi = ('need to', 'have to', 'going to',
+                              'follow up', 'next step')
+        self._modal_obligations = frozenset({'should', 'must', 'need', 'have'})
+
+        # With Spacy available the cue phrases are matched in C against
+        # token hashes instead of Python substring scans per sentence;
+        # built lazily alongside the model
+        self.matcher = None
+
+        # With pyahocorasick installed, cue detection is one automaton
+        # scan per category instead of the PhraseMatcher pass
+        self._cue_automatons = self._build_cue_automatons() if AHOCORASICK_AVAILABLE else None
+
+    def _build_cue_automatons(self) -> Dict[str, 'ahocorasick.Automaton']:
+        """Build one Aho-Corasick automaton per category over its literal
+        cue phrases, keyed by the same labels the PhraseMatcher uses"""
+        automatons = {}
+        for label, phrases in (
+                ("QUESTION", sorted(self._uncertainty_single) + list(self._uncertainty_multi)),
+                ("DECISION", sorted(self._decision_verbs | self._decision_nouns)
+                             + list(self._passive_decisions)),
+                ("ACTION", sorted(self._action_single) + list(self._action_multi))):
+            automaton = ahocorasick.Automaton()
+            for phrase in phrases:
+                automaton.add_word(phrase, phrase)
+            automaton.make_automaton()
+            automatons[label] = automaton
+        return automatons
+
+    @staticmethod
+    def _automaton_hits(automaton: 'ahocorasick.Automaton', text_lower: str) -> bool:
+        """True if any of the automaton's cue phrases occurs in text_lower
+        on word boundaries. The raw automaton matches substrings, so the
+        neighbouring characters are verified to keep parity with the
+        token-level PhraseMatcher ('will' must not fire inside 'Williams')"""
+        for end, phrase in automaton.iter(text_lower):
+            start = end - len(phrase) + 1
+            if start > 0 and text_lower[start - 1].isalnum():
+                continue
+            if end + 1 < len(text_lower) and text_lower[end + 1].isalnum():
+                continue
+            return True
+        return False
+
+    def _build_phrase_matcher(self) -> 'PhraseMatcher':
+        """Register all cue phrases in one PhraseMatcher keyed by category"""
+        nlp = _get_nlp()
+        matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        matcher.add("QUESTION", [nlp.make_doc(phrase) for phrase in
+                                 sorted(self._uncertainty_single) + list(self._uncertainty_multi)])
+        matcher.add("DECISION", [nlp.make_doc(phrase) for phrase in
+                                 sorted(self._decision_verbs | self._decision_nouns)
+                                 + list(self._passive_decisions)])
+        matcher.add("ACTION", [nlp.make_doc(phrase) for phrase in
+                               sorted(self._action_single) + list(self._action_multi)])
+        return matcher
+
+    @staticmethod
+    def _fuse_patterns(patterns: List[str]) -> re.Pattern:
+        """Combine a list of lowercase patterns into one compiled
+        alternation; callers lowercase the line once instead of paying
+        re.IGNORECASE's per-character case folding"""
+        return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+    def _build_hyperscan_dbs(self) -> Dict[str, 'hyperscan.Database']:
+        """Compile each category's patterns into a Hyperscan block-mode database"""
+        try:
+            databases = {}
+            for category, patterns in (("questions", self.question_patterns),
+                                       ("decisions", self.decision_patterns),
+                                       ("actions", self.action_patterns)):
+                # Block-mode scanning sees the whole text at once, so keep
+                # [^.!?] and \s from matching newlines - otherwise a cue on
+                # one line yields match ends on every line that follows it,
+                # which the per-line regex path never does
+                expressions = [p.replace('[^.!?]', '[^.!?\\n]')
+                                .replace('\\s', '[^\\S\\n]')
+                                .encode('utf-8') for p in patterns]
+                db = hyperscan.Database()
+                # The 'Name will ...' assignment pattern is deliberately
+                # case-sensitive in the regex path, so it alone loses the
+                # caseless flag here too
+                flags = [0 if p is self._action_name_pattern
+                         else hyperscan.HS_FLAG_CASELESS for p in patterns]
+                db.compile(expressions=expressions,
+                           ids=list(range(len(expressions))),
+                           flags=flags)
+                databases[category] = db
+            return databases
+        except Exception:
+            # Unsupported pattern constructs fall back to the regex path
+            return None
+
     def analyze_with_spacy(self, text: str) -> Dict[str, List[str]]:
         """Analyze text using Spacy NLP with enhanced logic"""
-        if not SPACY_AVAILABLE:
-            return self.analyze_with_patterns(text)
-        
+        actions, decisions, questions = self._analyze_cached(text)
+        return {"actions": list(actions),
+                "decisions": list(decisions),
+                "questions": list(questions)}
+
+    @functools.lru_cache(maxsize=32)
+    def _analyze_cached(self, text: str) -> tuple:
+        """Run the analysis, memoizing results so re-analyzing the same
+        notes is a cache hit. Returns immutable tuples per category."""
+        nlp = _get_nlp()
+        if nlp is None:
+            results = self.analyze_with_patterns(text)
+            return (tuple(results["actions"]),
+                    tuple(results["decisions"]),
+                    tuple(results["questions"]))
+
+        if self.matcher is None and self._cue_automatons is None:
+            self.matcher = self._build_phrase_matcher()
+
         doc = nlp(text)
         results = {"actions": [], "decisions": [], "questions": []}
-        
-        sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
-        
-        for sentence in sentences:
-            sentence_doc = nlp(sentence)
-            
-            # Analyze sentence structure
-            is_question = self._is_question(sentence, sentence_doc)
-            is_decision = self._is_decision(sentence, sentence_doc)
-            is_action = self._is_action(sentence, sentence_doc)
-            
-            # Categorize (questions take priority, then decisions, then actions)
-            if is_question:
-                results["questions"].append(sentence)
-            elif is_decision:
-                results["decisions"].append(sentence)
-            elif is_action:
-                results["actions"].append(sentence)
-        
-        # Remove duplicates while preserving order
-        for key in results:
-            results[key] = list(dict.fromkeys(results[key]))
-        
-        return results
+        seen = {"actions": set(), "decisions": set(), "questions": set()}
+
+        # The sentence Spans already carry POS/tag/entity annotations,
+        # so no second parse is needed
+        sentences = [(sent.text.strip(), sent) for sent in doc.sents]
+        sentences = [pair for pair in sentences if pair[0]]
+
+        # Classification per sentence is independent; for large transcripts
+        # spread the chunks over a thread pool (below that, thread startup
+        # costs more than it saves)
+        if len(sentences) > 200:
+            categories = self._classify_parallel(sentences)
+        else:
+            categories = [self._classify(sentence, sent)
+                          for sentence, sent in sentences]
+
+        for (sentence, _), category in zip(sentences, categories):
+            # Skip duplicates as they appear, preserving first-seen order
+            if category and sentence not in seen[category]:
+                seen[category].add(sentence)
+                results[category].append(sentence)
+
+        return (tuple(results["actions"]),
+                tuple(results["decisions"]),
+                tuple(results["questions"]))
+
+    def _classify_parallel(self, sentences: list) -> List[str]:
+        """Classify (sentence, Span) pairs in contiguous chunks across a
+        thread pool, returning categories in the original order"""
+        max_workers = os.cpu_count() or 1
+        chunk_size = -(-len(sentences) // max_workers)  # ceiling division
+        chunks = [sentences[i:i + chunk_size]
+                  for i in range(0, len(sentences), chunk_size)]
+
+        def classify_chunk(chunk):
+            return [self._classify(sentence, sent) for sentence, sent in chunk]
 
-    def _is_question(self, sentence: str, doc) -> bool:
-        """Enhanced question detection using Spacy"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = executor.map(classify_chunk, chunks)
+        return [category for chunk in chunk_results for category in chunk]
+
+    def _classify(self, sentence: str, doc) -> str:
+        """Classify a sentence as 'questions', 'decisions', 'actions' or
+        None (in that priority order), lowering the text and sweeping the
+        tokens exactly once"""
         # Direct question marks
         if '?' in sentence:
-            return True
-        
-        # Question words at the start
-        question_words = ['what', 'how', 'when', 'where', 'why', 'who', 'which', 'whose']
-        first_token = doc[0].text.lower() if doc else ""
-        if first_token in question_words:
-            return True
-        
-        # Uncertainty indicators
-        uncertainty_phrases = ['unclear', 'unsure', 'not sure', 'question', 'wondering', 
-                              'need clarification', 'open item', 'to be determined', 'tbd']
-        sentence_lower = sentence.lower()
-        if any(phrase in sentence_lower for phrase in uncertainty_phrases):
-            return True
-        
-        # Check for auxiliary verbs that might indicate questions
-        aux_verbs = ['do', 'does', 'did', 'can', 'could', 'will', 'would', 'should']
-        if doc and doc[0].text.lower() in aux_verbs and doc[0].pos_ == 'AUX':
-            return True
-        
-        return False
+            return "questions"
 
-    def _is_decision(self, sentence: str, doc) -> bool:
-        """Enhanced decision detection using Spacy"""
-        decision_verbs = ['decided', 'agreed', 'resolved', 'concluded', 'determined', 
-                         'approved', 'confirmed', 'finalized', 'settled']
-        decision_nouns = ['decision', 'agreement', 'resolution', 'conclusion', 
-                         'approval', 'confirmation', 'verdict', 'ruling']
-        
-        sentence_lower = sentence.lower()
-        
-        # Check for decision verbs
-        if any(verb in sentence_lower for verb in decision_verbs):
-            return True
-        
-        # Check for decision nouns
-        if any(noun in sentence_lower for noun in decision_nouns):
-            return True
-        
-        # Check for passive voice decisions
-        passive_indicators = ['it was decided', 'it was agreed', 'it was resolved']
-        if any(indicator in sentence_lower for indicator in passive_indicators):
-            return True
-        
-        # Use Spacy to find past tense verbs that might indicate decisions
-        for token in doc:
-            if token.pos_ == 'VERB' and token.tag_ in ['VBD', 'VBN']:  # Past tense verbs
-                if token.lemma_ in decision_verbs:
-                    return True
-        
-        return False
+        first_lower = doc[0].text.lower() if len(doc) else ""
 
-    def _is_action(self, sentence: str, doc) -> bool:
-        """Enhanced action item detection using Spacy"""
-        action_indicators = ['will', 'should', 'must', 'need to', 'have to', 'going to',
-                           'action', 'task', 'todo', 'assign', 'responsible', 'follow up',
-                           'next step', 'deliverable', 'owner']
-        
-        sentence_lower = sentence.lower()
-        
-        # Direct action indicators
-        if any(indicator in sentence_lower for indicator in action_indicators):
-            return True
-        
-        # Check for imperative mood (commands)
-        if doc and len(doc) > 0:
-            first_token = doc[0]
-            # Commands often start with base form verbs
-            if first_token.pos_ == 'VERB' and first_token.tag_ == 'VB':
-                return True
-        
-        # Check for future tense constructions
-        for i, token in enumerate(doc):
-            if token.text.lower() == 'will' and i + 1 < len(doc):
-                next_token = doc[i + 1]
-                if next_token.pos_ == 'VERB':
-                    return True
-        
-        # Check for modal verbs indicating obligation
-        modal_obligations = ['should', 'must', 'need', 'have']
+        # One C-level pass per category finds the cue phrases: an
+        # Aho-Corasick scan of the lowered sentence when available,
+        # otherwise the PhraseMatcher over the token hashes
+        if self._cue_automatons is not None:
+            sentence_lower = sentence.lower()
+            labels = {label for label, automaton in self._cue_automatons.items()
+                      if self._automaton_hits(automaton, sentence_lower)}
+        else:
+            labels = {self.matcher.vocab.strings[match_id]
+                      for match_id, start, end in self.matcher(doc)}
+
+        # Questions: leading question word, uncertainty cue, or leading
+        # auxiliary verb
+        if first_lower in self._question_words:
+            return "questions"
+        if 'QUESTION' in labels:
+            return "questions"
+        if len(doc) and first_lower in self._question_aux and doc[0].pos_ == 'AUX':
+            return "questions"
+
+        # Decisions: decision verbs/nouns or passive voice decisions
+        if 'DECISION' in labels:
+            return "decisions"
+
+        # Single sweep over the tokens for the structural signals the cue
+        # phrases cannot express
+        past_decision_verb = False
+        will_then_verb = False
+        modal_obligation = False
+        person_assignment = False
+        prev_lower = None
+        prev_is_person = False
         for token in doc:
-            if token.text.lower() in modal_obligations and token.pos_ in ['VERB', 'AUX']:
-                return True
-        
-        # Check for person names followed by action verbs (assignments)
-        for i, token in enumerate(doc):
-            if token.ent_type_ == 'PERSON' and i + 1 < len(doc):
-                next_token = doc[i + 1]
-                if next_token.text.lower() in ['will', 'should', 'must', 'to']:
-                    return True
-        
-        return False
+            text_lower = token.text.lower()
+
+            # Past tense decision verbs
+            if token.pos_ == 'VERB' and token.tag_ in ('VBD', 'VBN'):
+                if token.lemma_ in self._decision_verbs:
+                    past_decision_verb = True
+
+            # Future tense constructions ('will' + verb)
+            if prev_lower == 'will' and token.pos_ == 'VERB':
+                will_then_verb = True
+
+            # Modal verbs indicating obligation
+            if text_lower in self._modal_obligations and token.pos_ in ('VERB', 'AUX'):
+                modal_obligation = True
+
+            # Person names followed by action verbs (assignments)
+            if prev_is_person and text_lower in ('will', 'should', 'must', 'to'):
+                person_assignment = True
+
+            prev_lower = text_lower
+            prev_is_person = token.ent_type_ == 'PERSON'
+
+        if past_decision_verb:
+            return "decisions"
+
+        # Actions: direct indicators, imperative mood, future tense,
+        # obligation modals, or person assignments
+        if 'ACTION' in labels:
+            return "actions"
+        if len(doc) and doc[0].pos_ == 'VERB' and doc[0].tag_ == 'VB':
+            return "actions"
+        if will_then_verb or modal_obligation or person_assignment:
+            return "actions"
+
+        return None
 
     def analyze_with_patterns(self, text: str) -> Dict[str, List[str]]:
         """Fallback pattern-based analysis when Spacy is not available"""
+        if self._hs_databases is not None:
+            return self._analyze_with_hyperscan(text)
+
         results = {"actions": [], "decisions": [], "questions": []}
-        
+
+        # Bind lookups once outside the loop; this path is dominated by
+        # Python dispatch, not the regex engine
+        question_search = self.question_re.search
+        decision_search = self.decision_re.search
+        action_search = self.action_re.search
+        action_name_search = self.action_name_re.search
+        add_question = results["questions"].append
+        add_decision = results["decisions"].append
+        add_action = results["actions"].append
+
+        for line in self._iter_lines(text):
+            line_lower = line.lower()
+            # Check for questions first (highest priority)
+            if '?' in line or question_search(line_lower):
+                add_question(line)
+            # Then decisions
+            elif decision_search(line_lower):
+                add_decision(line)
+            # Finally actions
+            elif action_search(line_lower) or action_name_search(line):
+                add_action(line)
+
+        return results
+
+    @staticmethod
+    def _iter_lines(text: str):
+        """Yield the stripped, non-empty lines of text. With numpy
+        available, newline offsets are found in one vectorized pass over
+        the encoded buffer and only non-empty slices become str objects."""
+        if not NUMPY_AVAILABLE:
+            for line in text.split('\n'):
+                line = line.strip()
+                if line:
+                    yield line
+            return
+
+        data = text.encode('utf-8')
+        buf = np.frombuffer(data, dtype=np.uint8)
+        newlines = np.nonzero(buf == 0x0A)[0]
+
+        start = 0
+        for end in newlines:
+            end = int(end)
+            if end > start:
+                line = data[start:end].decode('utf-8').strip()
+                if line:
+                    yield line
+            start = end + 1
+        if start < len(data):
+            line = data[start:].decode('utf-8').strip()
+            if line:
+                yield line
+
+    def _analyze_with_hyperscan(self, text: str) -> Dict[str, List[str]]:
+        """Pattern analysis via Hyperscan: one scan of the full text per
+        category, with match offsets mapped back to their lines"""
+        data = text.encode('utf-8')
         lines = text.split('\n')
-        for line in lines:
+
+        # Byte offset of each line start, for mapping match offsets to lines
+        line_starts = []
+        offset = 0
+        for raw_line in data.split(b'\n'):
+            line_starts.append(offset)
+            offset += len(raw_line) + 1
+
+        hits = {"questions": set(), "decisions": set(), "actions": set()}
+        for category, db in self._hs_databases.items():
+            matched_lines = hits[category]
+
+            def on_match(match_id, start, end, flags, context,
+                         matched_lines=matched_lines):
+                matched_lines.add(bisect.bisect_right(line_starts, end - 1) - 1)
+
+            db.scan(data, match_event_handler=on_match)
+
+        results = {"actions": [], "decisions": [], "questions": []}
+        for index, line in enumerate(lines):
             line = line.strip()
             if not line:
                 continue
-            
-            # Check for questions first (highest priority)
-            if self._check_patterns(line, self.question_patterns):
+
+            # Same priority order as the regex path
+            if '?' in line or index in hits["questions"]:
                 results["questions"].append(line)
-            # Then decisions
-            elif self._check_patterns(line, self.decision_patterns):
+            elif index in hits["decisions"]:
                 results["decisions"].append(line)
-            # Finally actions
-            elif self._check_patterns(line, self.action_patterns):
+            elif index in hits["actions"]:
                 results["actions"].append(line)
-        
-        return results
 
-    def _check_patterns(self, text: str, patterns: List[str]) -> bool:
-        """Check if text matches any of the given patterns"""
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return results
 
 
 class MeetingNotesApp:
@@ -218,6 +491,18 @@ class MeetingNotesApp:
         
         self.analyzer = MeetingNotesAnalyzer()
         self.dark_mode = False
+        self._last_text_hash = None
+
+        # One compiled alternation per result pane, reused on every render
+        self.action_keyword_re = self._compile_keywords(
+            ["will", "should", "must", "need to", "action", "task", "todo",
+             "assign", "responsible"])
+        self.decision_keyword_re = self._compile_keywords(
+            ["decided", "agreed", "resolved", "concluded", "decision",
+             "approved", "confirmed"])
+        self.question_keyword_re = self._compile_keywords(
+            ["what", "how", "when", "where", "why", "who", "question",
+             "unclear", "unsure"])
         
         self.setup_styles()
         self.create_widgets()
@@ -381,7 +666,7 @@ class MeetingNotesApp:
             try:
                 if filename.endswith('.docx') and DOCX_AVAILABLE:
                     doc = docx.Document(filename)
-                    text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+                    text = '\n'.join(paragraph.text for paragraph in doc.paragraphs)
                 else:
                     with open(filename, 'r', encoding='utf-8') as file:
                         text = file.read()
@@ -393,11 +678,24 @@ class MeetingNotesApp:
             except Exception as e:
                 messagebox.showerror("Error", f"Could not load file: {str(e)}")
     
-    def highlight_keywords(self, text_widget, content: str, keywords: List[str]):
-        """Add keyword highlighting to text"""
+    @staticmethod
+    def _compile_keywords(keywords: List[str]) -> re.Pattern:
+        """Compile a keyword list into one case-insensitive alternation"""
+        return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+    def _render(self, text_widget, items: List[str], keyword_re: re.Pattern,
+                empty_message: str):
+        """Render one result pane in a single shot: build the content string
+        and every tag range in Python, then issue one delete, one insert and
+        one batched tag_add per tag to minimize Tk redraws"""
+        if items:
+            content = "\n\n".join(f"• {item}" for item in items)
+        else:
+            content = empty_message
+
         text_widget.delete(1.0, tk.END)
         text_widget.insert(1.0, content)
-        
+
         # Configure highlighting tags
         if self.dark_mode:
             text_widget.tag_configure("keyword", foreground="#66b3ff", font=("Arial", 9, "bold"))
@@ -405,70 +703,61 @@ class MeetingNotesApp:
         else:
             text_widget.tag_configure("keyword", foreground="#0066cc", font=("Arial", 9, "bold"))
             text_widget.tag_configure("bullet", foreground="#ff6600")
-        
-        # Highlight keywords
-        for keyword in keywords:
-            start_pos = '1.0'
-            while True:
-                pos = text_widget.search(keyword, start_pos, stopindex=tk.END, nocase=True)
-                if not pos:
-                    break
-                end_pos = f"{pos}+{len(keyword)}c"
-                text_widget.tag_add("keyword", pos, end_pos)
-                start_pos = end_pos
-        
-        # Highlight bullet points
-        start_pos = '1.0'
-        while True:
-            pos = text_widget.search("•", start_pos, stopindex=tk.END)
-            if not pos:
-                break
-            end_pos = f"{pos}+1c"
-            text_widget.tag_add("bullet", pos, end_pos)
-            start_pos = end_pos
-    
+
+        # Char offsets map to Tk line.col indices via the line-start table
+        line_starts = [0] + [i + 1 for i, ch in enumerate(content) if ch == '\n']
+
+        def to_index(offset: int) -> str:
+            line = bisect.bisect_right(line_starts, offset)
+            return f"{line}.{offset - line_starts[line - 1]}"
+
+        # Collect all ranges per tag, then hand each tag to Tk in one call
+        # (tag_add accepts any number of index pairs)
+        keyword_ranges = []
+        for match in keyword_re.finditer(content):
+            keyword_ranges += (to_index(match.start()), to_index(match.end()))
+        if keyword_ranges:
+            text_widget.tag_add("keyword", *keyword_ranges)
+
+        bullet_ranges = []
+        for offset, ch in enumerate(content):
+            if ch == '•':
+                bullet_ranges += (to_index(offset), to_index(offset + 1))
+        if bullet_ranges:
+            text_widget.tag_add("bullet", *bullet_ranges)
+
     def display_results(self, results: Dict[str, List[str]]):
         """Display analysis results with keyword highlighting"""
-        action_keywords = ["will", "should", "must", "need to", "action", "task", "todo", "assign", "responsible"]
-        decision_keywords = ["decided", "agreed", "resolved", "concluded", "decision", "approved", "confirmed"]
-        question_keywords = ["what", "how", "when", "where", "why", "who", "question", "unclear", "unsure"]
-        
-        # Display actions
-        actions = results.get("actions", [])
-        if actions:
-            actions_content = "\n\n".join([f"• {action}" for action in actions])
-        else:
-            actions_content = "No action items found in the meeting notes."
-        self.highlight_keywords(self.action_text, actions_content, action_keywords)
-        
-        # Display decisions
-        decisions = results.get("decisions", [])
-        if decisions:
-            decisions_content = "\n\n".join([f"• {decision}" for decision in decisions])
-        else:
-            decisions_content = "No decisions found in the meeting notes."
-        self.highlight_keywords(self.decision_text, decisions_content, decision_keywords)
-        
-        # Display questions
-        questions = results.get("questions", [])
-        if questions:
-            questions_content = "\n\n".join([f"• {question}" for question in questions])
-        else:
-            questions_content = "No open questions found in the meeting notes."
-        self.highlight_keywords(self.question_text, questions_content, question_keywords)
+        self._render(self.action_text, results.get("actions", []),
+                     self.action_keyword_re,
+                     "No action items found in the meeting notes.")
+        self._render(self.decision_text, results.get("decisions", []),
+                     self.decision_keyword_re,
+                     "No decisions found in the meeting notes.")
+        self._render(self.question_text, results.get("questions", []),
+                     self.question_keyword_re,
+                     "No open questions found in the meeting notes.")
     
     def analyze_notes(self):
         text = self.text_input.get(1.0, tk.END).strip()
         if not text:
             messagebox.showwarning("Warning", "Please enter some meeting notes first.")
             return
-        
+
+        # Unchanged text means unchanged results - redisplay the last
+        # analysis instead of re-running the pipeline
+        text_hash = hash(text)
+        if text_hash == self._last_text_hash and hasattr(self, 'current_results'):
+            self.finish_analysis(self.current_results)
+            return
+
         self.status_var.set("Analyzing meeting notes...")
         self.root.update()
-        
+
         def analyze_thread():
             try:
                 results = self.analyzer.analyze_with_spacy(text)
+                self._last_text_hash = text_hash
                 self.root.after(0, lambda: self.finish_analysis(results))
             except Exception as e:
                 self.root.after(0, lambda: self.analysis_error(str(e)))
@@ -498,6 +787,7 @@ class MeetingNotesApp:
         self.decision_text.delete(1.0, tk.END)
         self.question_text.delete(1.0, tk.END)
         self.status_var.set("Ready - All content cleared")
+        self._last_text_hash = None
         if hasattr(self, 'current_results'):
             delattr(self, 'current_results')
     